@@ -1,16 +1,26 @@
 #!/usr/bin/env python3
 import os
 import argparse
-from typing import List, Dict, Any, Set, Optional
+import fnmatch
+import heapq
+import mmap
+import re
+import multiprocessing
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import closing
+from itertools import starmap
+from operator import attrgetter
+from typing import Dict, FrozenSet, Iterator, List, NamedTuple, Optional, Sequence, Tuple
 
 # --- Configuration ---
 # Customize these for your project.
 
 # Directories to skip during the scan.
-DEFAULT_SKIP_DIRS = {
+DEFAULT_SKIP_DIRS = frozenset({
     '__pycache__', '.git', 'node_modules', 'venv', 'env', '.venv', '.env',
     'logs', '!backups'
-}
+})
 
 # File extensions to skip, organized by category.
 # The script generates an exclusion list in the report based on this structure.
@@ -42,244 +52,547 @@ DEFAULT_SKIP_EXTENSIONS_BY_CATEGORY = {
     }
 }
 
-# Flatten the categorized extensions into a single set for efficient lookup.
-DEFAULT_SKIP_EXTENSIONS = {
+# Flatten the categorized extensions into a single frozenset for efficient lookup.
+DEFAULT_SKIP_EXTENSIONS = frozenset(
     ext for category in DEFAULT_SKIP_EXTENSIONS_BY_CATEGORY.values() for ext in category
-}
+)
+
+# Specific filenames excluded from every scan, alongside hidden files.
+IGNORED_NAMES = frozenset({'desktop.ini', '__init__.py'})
+
+# Dot-free view of the default skip set, matching the normalized extensions
+# the pipeline carries.
+_SKIP_EXTS_NODOT = frozenset(e.lstrip('.') for e in DEFAULT_SKIP_EXTENSIONS)
+
+# Extensions repeat massively across a repo; normalizing through this cache
+# returns the same interned string every time instead of a fresh lowercase
+# allocation per file.
+_EXT_CACHE: Dict[str, str] = {}
+
+def _compile_excludes(patterns: Optional[Sequence[str]]) -> Optional['re.Pattern']:
+    """Compile glob patterns into a single alternation regex, or None.
+
+    fnmatch.translate anchors each pattern, so one C-level match per file
+    replaces a Python-interpreted fnmatchcase call per pattern.
+    """
+    if not patterns:
+        return None
+    return re.compile('|'.join(fnmatch.translate(p) for p in patterns))
+
+def _accept(
+    name: str,
+    skip: FrozenSet[str] = _SKIP_EXTS_NODOT,
+    ignored: FrozenSet[str] = IGNORED_NAMES,
+    exclude: Optional['re.Pattern'] = None
+) -> Optional[str]:
+    """Run the whole per-file filter chain in a single call.
+
+    Returns the interned dot-free extension ('none' if there isn't one) for
+    accepted filenames, or None for hidden, ignored, blacklisted, or
+    exclude-matched ones.
+    Fusing the checks saves several Python-level calls per file; the skip
+    and ignored sets are bound as defaults so lookups skip the globals dict.
+
+    Hidden files are rejected up front, so the splitext edge cases around
+    leading dots don't apply and a plain rfind finds the extension.
+    """
+    if not name or name[0] == '.' or name in ignored:
+        return None
+    if exclude is not None and exclude.match(name):
+        return None
+    i = name.rfind('.')
+    if i > 0:
+        ext = name[i + 1:].lower()
+        ext = _EXT_CACHE.setdefault(ext, ext)
+    else:
+        ext = 'none'
+    if ext in skip:
+        return None
+    return ext
+
+# Worker pool size for the scan. The work is I/O-bound, so oversubscribe the
+# CPUs; cap it so huge machines don't spawn hundreds of threads.
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Tasks handed to each worker process per IPC round trip; batching amortizes
+# the pickle overhead of imap_unordered.
+POOL_CHUNK_SIZE = 64
+
+# Buffer for the streamed report, batching write() syscalls the same way
+# READ_BUFFER_SIZE batches reads.
+WRITE_BUFFER_SIZE = 1 << 20
+
 
-def count_lines(filepath: str) -> int:
+class FileInfo(NamedTuple):
+    """One scanned file. A fixed-layout tuple instead of a per-file dict:
+    no hash probes on field access, and a fraction of the memory per record,
+    which keeps big scans cache-friendly to sort."""
+    path: str
+    ext: str  # Extension without the dot, or 'none'
+    lines: int
+    size_kb: float
+    path_lc: str  # Precomputed lowercase sort key, not emitted
+
+# Read files in 1 MiB chunks; io.DEFAULT_BUFFER_SIZE (8 KiB) is far too small
+# for modern disks and just multiplies the number of read() syscalls.
+READ_BUFFER_SIZE = 1 << 20
+
+# Bytes sniffed from the head of each file: a NUL byte there marks the file
+# as binary so we skip counting it, whatever its extension claims.
+SNIFF_SIZE = 4096
+
+# Files at least this big are counted through a read-only mmap: the kernel
+# streams pages straight into the page cache with no userspace copy.
+MMAP_MIN_FILE_SIZE = 16 << 20
+
+# Numba is strictly optional: if it (and NumPy) are installed, large files get
+# an LLVM-vectorized newline counter over an mmap'd view; otherwise every file
+# takes the bytes.count path. Files below 64 KiB always stay on the plain path
+# since they wouldn't amortize the kernel dispatch overhead.
+NUMBA_MIN_FILE_SIZE = 64 << 10
+
+try:
+    import numpy as _np
+    from numba import njit as _njit
+
+    @_njit(cache=True, fastmath=True)
+    def _count_nl(buf):
+        n = 0
+        for i in range(buf.shape[0]):
+            n += buf[i] == 10
+        return n
+except ImportError:
+    _np = None
+    _count_nl = None
+
+def _count_lines_mmap(fd: int, size: int) -> int:
+    """Count newlines in an already-open large file through a read-only mmap.
+
+    The mapping avoids any userspace copy, and MADV_SEQUENTIAL (where the
+    platform has it) tells the kernel to read ahead aggressively and drop
+    pages behind us. The count itself is the Numba kernel when available,
+    otherwise bytes.count over slices of the map.
+    """
+    mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    try:
+        if hasattr(mmap, 'MADV_SEQUENTIAL'):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        if _count_nl is not None:
+            buf = _np.frombuffer(mm, dtype=_np.uint8)
+            lines = int(_count_nl(buf))
+            # Drop the view before closing, or mmap raises BufferError.
+            del buf
+        else:
+            # mmap has no count(); scan it in slices, which read from the
+            # page cache without any further syscalls.
+            lines = 0
+            for offset in range(0, size, READ_BUFFER_SIZE):
+                lines += mm[offset:offset + READ_BUFFER_SIZE].count(b'\n')
+        # Count a final line that doesn't end with a newline.
+        if mm[-1] != 0x0A:
+            lines += 1
+    finally:
+        mm.close()
+    return lines
+
+# Files up to this size are read with one os.read call sized to the file
+# instead of the chunk loop; the cap keeps a pathological single allocation
+# from blowing up peak memory.
+SINGLE_READ_MAX = 64 << 20
+
+def count_lines(
+    filepath: str,
+    st_size: Optional[int] = None,
+    sniff: bool = True
+) -> Optional[int]:
     """Count the number of lines in a file.
-    
+
+    Reads the file in binary mode and counts b'\\n' bytes, which runs as a
+    tight C loop per chunk instead of decoding UTF-8 line by line. A final
+    line without a trailing newline is still counted. When the caller
+    already knows the file size (from the walk's DirEntry stat), zero-byte
+    files are skipped without even opening them, and anything up to
+    SINGLE_READ_MAX is read in a single call.
+
     Args:
         filepath: Path to the file
-        
+        st_size: File size in bytes, if already known
+        sniff: Reject files with a NUL byte in the first 4 KiB as binary
+
     Returns:
-        int: Number of lines in the file, or 0 if file can't be read
+        Number of lines in the file (0 if it can't be read), or None if the
+        sniff identified the file as binary
     """
+    if st_size == 0:
+        return 0
     try:
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            return sum(1 for _ in f)
-    except (IOError, UnicodeDecodeError):
-        # Return 0 if the file cannot be opened or read.
+        # Raw fd reads skip the Python file-object layer entirely.
+        fd = os.open(filepath, os.O_RDONLY)
+    except OSError:
+        # Return 0 if the file cannot be opened.
         return 0
 
+    lines = 0
+    last_chunk = b'\n'
+    try:
+        if st_size is None:
+            st_size = os.fstat(fd).st_size
+            if st_size == 0:
+                return 0
+
+        if st_size >= MMAP_MIN_FILE_SIZE or (
+            _count_nl is not None and st_size >= NUMBA_MIN_FILE_SIZE
+        ):
+            if sniff:
+                head = os.read(fd, SNIFF_SIZE)
+                if head.find(b'\x00') != -1:
+                    return None
+                os.lseek(fd, 0, os.SEEK_SET)
+            try:
+                return _count_lines_mmap(fd, st_size)
+            except (OSError, ValueError):
+                # mmap can fail (exhausted address space, >2 GiB files on
+                # 32-bit Windows); fall back to plain reads.
+                pass
+
+        if st_size <= SINGLE_READ_MAX:
+            # One allocation and, normally, one syscall covers the file.
+            chunk = os.read(fd, st_size)
+            if sniff and chunk.find(b'\x00', 0, SNIFF_SIZE) != -1:
+                return None
+            if chunk:
+                lines = chunk.count(b'\n')
+                last_chunk = chunk
+            if len(chunk) == st_size:
+                if not last_chunk.endswith(b'\n'):
+                    lines += 1
+                return lines
+            # Short read (the file shrank or grew under us); finish with
+            # the chunk loop below.
+
+        chunk = os.read(fd, READ_BUFFER_SIZE)
+        while chunk:
+            lines += chunk.count(b'\n')
+            last_chunk = chunk
+            chunk = os.read(fd, READ_BUFFER_SIZE)
+        # Count a final line that doesn't end with a newline.
+        if not last_chunk.endswith(b'\n'):
+            lines += 1
+    except OSError:
+        # Return 0 if the file cannot be read.
+        return 0
+    finally:
+        os.close(fd)
+    return lines
+
+# A file accepted by the walk, waiting to be counted:
+# (filepath, prefix_len, ext, st_size, sniff).
+FileTask = Tuple[str, int, str, int, bool]
+
+# Backslash-to-slash translation table, only needed where os.sep isn't
+# already '/'; on POSIX the replace would be a pointless full-string scan.
+_SEP_TRANSLATE = str.maketrans('\\', '/') if os.sep != '/' else None
+
+def _process_file(task: FileTask) -> Optional[FileInfo]:
+    """Count a single file's lines, returning its FileInfo or None if skipped.
+
+    Runs inside a worker, so it must stay a top-level function (picklable for
+    process pools) and must not touch shared mutable state. Name and
+    extension filtering already happened in the walk, and the size comes from
+    the DirEntry stat there, so this only pays for the line count.
+    """
+    filepath, prefix_len, ext, st_size, sniff = task
+
+    # The walk rooted every path under startpath, so the relative path is a
+    # plain slice; normalize to forward slashes only where needed.
+    rel_path = filepath[prefix_len:]
+    if _SEP_TRANSLATE is not None:
+        rel_path = rel_path.translate(_SEP_TRANSLATE)
+
+    line_count = count_lines(filepath, st_size, sniff)
+    if line_count is None:
+        # The sniff caught a binary file the extension blacklist missed.
+        return None
+
+    return FileInfo(
+        path=rel_path,
+        ext=ext,
+        lines=line_count,
+        size_kb=st_size / 1024,
+        path_lc=rel_path.lower()
+    )
+
+def _walk_files(
+    startpath: str,
+    skip_dirs: FrozenSet[str],
+    skip_extensions: FrozenSet[str],
+    sniff: bool = True,
+    exclude: Optional[Sequence[str]] = None
+) -> Iterator[FileTask]:
+    """Yield a FileTask for every accepted file under startpath.
+
+    The walk is an explicit os.scandir DFS, so directory type and size come
+    from the cached DirEntry stat instead of a separate stat syscall per
+    file. Lazy so the consuming pool can start counting while the walk is
+    still running.
+    """
+    # The public skip set uses dotted extensions; compare against the
+    # normalized dot-free form the rest of the pipeline carries.
+    skip_exts_nodot = frozenset(e.lstrip('.') for e in skip_extensions)
+    exclude_re = _compile_excludes(exclude)
+    accept = _accept
+    prefix_len = len(startpath.rstrip(os.sep)) + 1
+    pending = deque([startpath])
+    while pending:
+        current = pending.pop()
+        try:
+            entries = os.scandir(current)
+        except OSError:
+            continue
+
+        with entries:
+            for entry in entries:
+                name = entry.name
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        # Prune the search space before descending
+                        if name not in skip_dirs:
+                            pending.append(entry.path)
+                        continue
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+
+                    # One fused call covers the hidden/ignored-name checks
+                    # and the extension blacklist.
+                    ext = accept(name, skip_exts_nodot, IGNORED_NAMES, exclude_re)
+                    if ext is None:
+                        continue
+
+                    # Cached from the scandir result on most platforms,
+                    # so this usually costs no extra syscall.
+                    st_size = entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    # Skip entries that are inaccessible
+                    continue
+
+                yield (entry.path, prefix_len, ext, st_size, sniff)
+
 def get_file_info(
     startpath: str,
-    skip_dirs: Optional[Set[str]] = None,
-    skip_extensions: Optional[Set[str]] = None
-) -> List[Dict[str, Any]]:
+    skip_dirs: FrozenSet[str] = DEFAULT_SKIP_DIRS,
+    skip_extensions: FrozenSet[str] = DEFAULT_SKIP_EXTENSIONS,
+    use_processes: bool = False,
+    jobs: Optional[int] = None,
+    sniff: bool = True,
+    exclude: Optional[Sequence[str]] = None
+) -> List[FileInfo]:
     """Get information about all files in a directory tree.
-    
+
+    Line counting for each accepted file is fanned out to a worker pool,
+    overlapping syscall latency across files. Threads are the default; with
+    use_processes, a multiprocessing.Pool sidesteps the GIL for CPU-heavy
+    scans, streaming tasks in batches via imap_unordered.
+
     Args:
         startpath: Root directory to scan
         skip_dirs: Set of directory names to skip
         skip_extensions: Set of file extensions to skip (including leading dot)
-        
+        use_processes: Use a process pool instead of threads (helps on
+            CPU-heavy repos with huge text files)
+        jobs: Worker process count for use_processes (default: CPU count)
+        sniff: Skip files with a NUL byte in their first 4 KiB, catching
+            binaries the extension blacklist misses
+        exclude: Glob patterns; file names matching any are skipped
+
     Returns:
-        List of dictionaries with file information
+        List of FileInfo records
     """
-    if skip_dirs is None:
-        skip_dirs = DEFAULT_SKIP_DIRS
-    if skip_extensions is None:
-        skip_extensions = DEFAULT_SKIP_EXTENSIONS
-        
     file_info = []
-    
-    for root, dirs, files in os.walk(startpath, topdown=True):
-        # Modify dirs in-place to prune the search space
-        dirs[:] = [d for d in dirs if d not in skip_dirs]
-        
-        for file in files:
-            # Skip hidden files (starting with '.'), __init__.py, and desktop.ini
-            if file.startswith('.') or file == 'desktop.ini' or file == '__init__.py':
-                continue
-                
-            # Get file extension and normalize to lowercase
-            _, ext = os.path.splitext(file)
-            ext = ext.lower()
-            
-            # Skip files with blacklisted extensions
-            if ext in skip_extensions:
-                continue
-                
-            filepath = os.path.join(root, file)
-            # Create a consistent, forward-slash-based relative path
-            rel_path = os.path.relpath(filepath, startpath).replace('\\', '/')
-            
-            # Skip files that are inaccessible
-            try:
-                size_kb = os.path.getsize(filepath) / 1024
-            except OSError:
-                continue
-                
-            line_count = count_lines(filepath)
-            
-            file_info.append({
-                'path': rel_path,
-                'lines': line_count,
-                'size_kb': size_kb,
-                'ext': ext[1:] if ext else 'none'  # Store extension without the dot
-            })
-    
-    return sorted(file_info, key=lambda x: x['path'].lower())
+    tasks = _walk_files(startpath, skip_dirs, skip_extensions, sniff, exclude)
+
+    if use_processes:
+        pool = multiprocessing.Pool(jobs or os.cpu_count())
+        with closing(pool):
+            for info in pool.imap_unordered(_process_file, tasks, chunksize=POOL_CHUNK_SIZE):
+                if info is not None:
+                    file_info.append(info)
+    else:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = [executor.submit(_process_file, task) for task in tasks]
+            for future in as_completed(futures):
+                info = future.result()
+                if info is not None:
+                    file_info.append(info)
 
-def generate_markdown_table(file_info: List[Dict[str, Any]]) -> str:
+    return sorted(file_info, key=attrgetter('path_lc'))
+
+# Row templates bound once to str.format; per row this skips rebuilding the
+# f-string code path and goes straight to the C formatter.
+_FULL_ROW_FMT = "| `{0}` | {1} | {2:,} | {3:.1f} |\n".format
+_RANKED_ROW_FMT = "| {0} | `{1}` | {2:,} | {3:.1f} |\n".format
+_PLAIN_ROW_FMT = "| `{0}` | {1:,} | {2:.1f} |\n".format
+
+def generate_markdown_table(file_info: List[FileInfo]) -> Iterator[str]:
     """Generate a markdown table from file information, sorted by line count (descending).
     
     Args:
-        file_info: List of file information dictionaries
+        file_info: List of FileInfo records
         
-    Returns:
-        str: Formatted markdown table
+    Yields:
+        Lines of a formatted markdown table
     """
     if not file_info:
-        return "*No files found matching the criteria.*"
-    
-    # Sort by line count (descending) then by filename (ascending)
+        yield "*No files found matching the criteria.*\n"
+        return
+
+    # Sort by line count (descending) then by filename (ascending).
+    # file_info arrives sorted by the precomputed lowercase path, so a
+    # stable sort on lines alone preserves the name tie-break.
     sorted_info = sorted(
-        file_info,
-        key=lambda x: (-x['lines'], x['path'].lower())
+        sorted(file_info, key=attrgetter('path_lc')),
+        key=attrgetter('lines'),
+        reverse=True
     )
-        
-    table = ["| File | Extension | Lines | Size (KB) |", "|------|-----------|-------|-----------|"]
-    for info in sorted_info:
-        # Format numbers with commas for readability
-        table.append(f"| `{info['path']}` | {info['ext']} | {info['lines']:,} | {info['size_kb']:.1f} |")
-    
-    return '\n'.join(table)
 
-def generate_file_table(files: List[Dict[str, Any]], show_rank: bool = False) -> str:
+    yield "| File | Extension | Lines | Size (KB) |\n"
+    yield "|------|-----------|-------|-----------|\n"
+    # FileInfo's field order lines up with the template's slots (str.format
+    # ignores the trailing sort key), so starmap runs the whole row loop in
+    # C with no per-row Python frame.
+    yield from starmap(_FULL_ROW_FMT, sorted_info)
+
+def generate_file_table(files: List[FileInfo], show_rank: bool = False) -> Iterator[str]:
     """Generate a markdown table from file information.
     
     Args:
-        files: List of file information dictionaries
+        files: List of FileInfo records
         show_rank: Whether to show rank column
         
-    Returns:
-        str: Formatted markdown table
+    Yields:
+        Lines of a formatted markdown table
     """
     if not files:
-        return "*No files found matching the criteria.*"
-    
+        yield "*No files found matching the criteria.*\n"
+        return
+
     headers = ["Rank", "File", "Lines", "Size (KB)"] if show_rank else ["File", "Lines", "Size (KB)"]
     separator = ["------"] * len(headers)
-    
-    table = [
-        "| " + " | ".join(headers) + " |",
-        "|" + "|".join(separator) + "|"
-    ]
-    
-    for i, info in enumerate(files, 1):
-        row = []
-        if show_rank:
-            row.append(str(i))
-        row.extend([
-            f"`{info['path']}`",
-            f"{info['lines']:,}",
-            f"{info['size_kb']:.1f}"
-        ])
-        table.append(f"| {' | '.join(row)} |")
-    
-    return '\n'.join(table)
 
-def generate_top_files_table(file_info: List[Dict[str, Any]], top_n: int = 10) -> str:
+    yield "| " + " | ".join(headers) + " |\n"
+    yield "|" + "|".join(separator) + "|\n"
+
+    if show_rank:
+        fmt = _RANKED_ROW_FMT
+        for i, info in enumerate(files, 1):
+            yield fmt(i, info.path, info.lines, info.size_kb)
+    else:
+        fmt = _PLAIN_ROW_FMT
+        for info in files:
+            yield fmt(info.path, info.lines, info.size_kb)
+
+def generate_top_files_table(file_info: List[FileInfo], top_n: int = 10) -> Iterator[str]:
     """Generate a table of the largest files by line count.
     
     Args:
-        file_info: List of file information dictionaries
+        file_info: List of FileInfo records
         top_n: Number of top files to include
         
-    Returns:
-        str: Formatted markdown table
+    Yields:
+        Lines of a formatted markdown table
     """
     if not file_info:
-        return "*No files found matching the criteria.*"
-        
+        yield "*No files found matching the criteria.*\n"
+        return
+
     # Filter out empty files and sort by line count (descending)
-    non_empty_files = [f for f in file_info if f['lines'] > 0]
+    non_empty_files = [f for f in file_info if f.lines > 0]
     if not non_empty_files:
-        return "*No non-empty files found.*"
-        
-    sorted_files = sorted(non_empty_files, key=lambda x: x['lines'], reverse=True)[:top_n]
-    return generate_file_table(sorted_files, show_rank=True)
+        yield "*No non-empty files found.*\n"
+        return
 
-def generate_bottom_files_table(file_info: List[Dict[str, Any]], bottom_n: int = 5) -> str:
+    # O(N log k) partial heap sort; like sorted()[:top_n] it is stable, so
+    # the incoming name order still breaks ties.
+    top_files = heapq.nlargest(top_n, non_empty_files, key=attrgetter('lines'))
+    yield from generate_file_table(top_files, show_rank=True)
+
+def generate_bottom_files_table(file_info: List[FileInfo], bottom_n: int = 5) -> Iterator[str]:
     """Generate a table of the smallest files by line count.
     
     Args:
-        file_info: List of file information dictionaries
+        file_info: List of FileInfo records
         bottom_n: Number of bottom files to include
         
-    Returns:
-        str: Formatted markdown table
+    Yields:
+        Lines of a formatted markdown table
     """
     if not file_info:
-        return "*No files found matching the criteria.*"
-        
+        yield "*No files found matching the criteria.*\n"
+        return
+
     # Filter out empty files and sort by line count (ascending)
-    non_empty_files = [f for f in file_info if f['lines'] > 0]
+    non_empty_files = [f for f in file_info if f.lines > 0]
     if not non_empty_files:
-        return "*No non-empty files found.*"
-        
-    sorted_files = sorted(non_empty_files, key=lambda x: x['lines'])[:bottom_n]
-    return generate_file_table(sorted_files, show_rank=True)
+        yield "*No non-empty files found.*\n"
+        return
+
+    bottom_files = heapq.nsmallest(bottom_n, non_empty_files, key=attrgetter('lines'))
+    yield from generate_file_table(bottom_files, show_rank=True)
+
+def generate_exclusions_list() -> Iterator[str]:
+    """Yield a formatted list of excluded file types and directories."""
+    yield "## Excluded File Types and Directories\n"
+    yield "\n"
 
-def generate_exclusions_list() -> str:
-    """Generate a formatted list of excluded file types and directories."""
-    lines = ["## Excluded File Types and Directories"]
-    lines.append("")
-    
     # Generate the list of excluded file extensions from the categorized dictionary
     for category, extensions in sorted(DEFAULT_SKIP_EXTENSIONS_BY_CATEGORY.items()):
-        lines.append(f"### {category}")
+        yield f"### {category}\n"
         # Sort extensions for consistent ordering
-        lines.append(", ".join(f"`{ext}`" for ext in sorted(extensions)))
-        lines.append("")  # Add a blank line for spacing
-    
-    lines.append("### Excluded Directories")
-    lines.append(", ".join(f"`{d}`" for d in sorted(DEFAULT_SKIP_DIRS)))
-    lines.append(
+        yield ", ".join(f"`{ext}`" for ext in sorted(extensions)) + "\n"
+        yield "\n"  # Add a blank line for spacing
+
+    yield "### Excluded Directories\n"
+    yield ", ".join(f"`{d}`" for d in sorted(DEFAULT_SKIP_DIRS)) + "\n"
+    yield (
         "\n*Note: The scan also excludes hidden files (names starting with a `.period` ), "
-        "`__init__.py`, and `desktop.ini` files.*"
+        "`__init__.py`, and `desktop.ini` files.*\n"
     )
-    
-    return "\n".join(lines)
-
-
-def generate_report(start_path: str, file_info: List[Dict[str, Any]], top_n: int) -> str:
-    """Generates the full markdown report string."""
-    report_parts = [
-        "# Line Count Report",
-        f"*Generated at: `{start_path}`*",
-        "",
-        "## File Statistics",
-        f"- **Total files analyzed:** {len(file_info):,}",
-        f"- **Total lines of code:** {sum(f['lines'] for f in file_info):,}",
-        "",
-        "## Largest Files",
-        f"*Top {top_n} files by line count*",
-        "",
-        generate_top_files_table(file_info, top_n),
-        "",
-        "---",
-        "",
-        "## Smallest Files",
-        "*Top 5 smallest non-empty files*",
-        "",
-        generate_bottom_files_table(file_info, 5),
-        "",
-        "---",
-        "",
-        "## Complete File List",
-        "*Sorted by line count (descending), then by filename*",
-        "",
-        generate_markdown_table(file_info),
-        "",
-        "---",
-        "",
-        generate_exclusions_list()
-    ]
-    return "\n".join(report_parts)
+
+
+def generate_report(start_path: str, file_info: List[FileInfo], top_n: int) -> Iterator[str]:
+    """Yield the full markdown report line by line.
+
+    Streaming the lines straight into the output buffer keeps peak memory
+    flat instead of holding the whole report as one giant string.
+    """
+    yield "# Line Count Report\n"
+    yield f"*Generated at: `{start_path}`*\n"
+    yield "\n"
+    yield "## File Statistics\n"
+    yield f"- **Total files analyzed:** {len(file_info):,}\n"
+    yield f"- **Total lines of code:** {sum(f.lines for f in file_info):,}\n"
+    yield "\n"
+    yield "## Largest Files\n"
+    yield f"*Top {top_n} files by line count*\n"
+    yield "\n"
+    yield from generate_top_files_table(file_info, top_n)
+    yield "\n"
+    yield "---\n"
+    yield "\n"
+    yield "## Smallest Files\n"
+    yield "*Top 5 smallest non-empty files*\n"
+    yield "\n"
+    yield from generate_bottom_files_table(file_info, 5)
+    yield "\n"
+    yield "---\n"
+    yield "\n"
+    yield "## Complete File List\n"
+    yield "*Sorted by line count (descending), then by filename*\n"
+    yield "\n"
+    yield from generate_markdown_table(file_info)
+    yield "\n"
+    yield "---\n"
+    yield "\n"
+    yield from generate_exclusions_list()
 
 def parse_arguments() -> argparse.Namespace:
     """Parse command line arguments."""
@@ -304,6 +617,31 @@ def parse_arguments() -> argparse.Namespace:
         default=10,
         help='Number of top files to show in the summary table (default: 10).'
     )
+    parser.add_argument(
+        '--processes',
+        action='store_true',
+        help='Use a process pool instead of threads (bypasses the GIL for\n'
+             'CPU-heavy scans of repos with huge text files).'
+    )
+    parser.add_argument(
+        '-x', '--exclude',
+        action='append',
+        metavar='GLOB',
+        help='Glob pattern of file names to exclude (repeatable).'
+    )
+    parser.add_argument(
+        '--no-binary-sniff',
+        action='store_false',
+        dest='binary_sniff',
+        help='Trust the extension blacklist alone instead of skipping files\n'
+             'with a NUL byte in their first 4 KiB.'
+    )
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=None,
+        help='Worker process count for --processes (default: CPU count).'
+    )
     return parser.parse_args()
 
 
@@ -319,20 +657,24 @@ def main() -> None:
         return
     
     print(f"Analyzing files in: {start_path}...")
-    file_info = get_file_info(start_path)
+    file_info = get_file_info(
+        start_path,
+        use_processes=args.processes,
+        jobs=args.jobs,
+        sniff=args.binary_sniff,
+        exclude=args.exclude
+    )
     
     if not file_info:
         print("No files found matching the criteria. Report not generated.")
         return
     
-    # Generate the report content
-    report_content = generate_report(start_path, file_info, args.top_n)
-    
-    # Write the report to the specified output file
+    # Stream the report to the specified output file. The large buffer
+    # batches the underlying write() syscalls.
     output_path = os.path.abspath(args.output)
     try:
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(report_content)
+        with open(output_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+            f.writelines(generate_report(start_path, file_info, args.top_n))
         print(f"Report generated successfully: {output_path}")
     except IOError as e:
         print(f"Error writing to {output_path}: {e}")